@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import sys
@@ -6,18 +7,48 @@ from datetime import datetime, timedelta, timezone
 import pathlib
 import shutil
 import tempfile
+import time
 import zipfile
 import warnings
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import combinations, islice
 
+import dask
 import eumdac
-import imageio.v3 as iio
+import imageio.v2 as imageio
+import numpy as np
+import satpy
 import tweepy
+from requests.adapters import HTTPAdapter
+from PIL import Image
 from satpy import Scene
+from satpy.writers import get_enhanced_image
 from pyresample import create_area_def
 
 
 logger = logging.getLogger(__name__)
 
+try:
+    from remotezip import RemoteZip
+except ImportError:
+    RemoteZip = None
+
+try:
+    from isal import isal_zlib
+
+    # zipfile resolves zlib through its module global, so pointing that at
+    # ISA-L gives every archive extraction SIMD-accelerated DEFLATE without
+    # touching the call sites. Stdlib zlib remains the fallback.
+    zipfile.zlib = isal_zlib
+except ImportError:
+    pass
+
 warnings.filterwarnings(
     "ignore",
     message="invalid value encountered",
@@ -30,27 +61,111 @@ class NoDataAvailable(RuntimeError):
     pass
 
 
+# Cache satpy's precomputed geolocation/resampling data on disk: the target
+# area never changes, so every product after the first reuses the same
+# nearest-neighbour indices instead of rebuilding the KDTree per scene. The
+# directory lives in the working tree so the GitHub Actions cache can carry
+# it across daily runs, making the KDTree build a one-off.
+SATPY_CACHE_DIR = os.environ.get("SATPY_CACHE_DIR", ".satpy_cache")
+# Rendered frames are cached content-addressed by their .nat bytes, so a
+# rerun on the same day (e.g. the workflow's retry after an upload failure)
+# skips the whole satpy pipeline and reduces to numpy loads.
+FRAME_CACHE_DIR = os.environ.get("FRAME_CACHE_DIR", ".frame_cache")
+satpy.config.set(
+    {
+        "cache_dir": SATPY_CACHE_DIR,
+        "cache_lonlats": True,
+        "cache_sensor_angles": True,
+    }
+)
+dask.config.set({"array.chunk-size": "64MiB", "scheduler": "threads"})
+
+# The grid is specified by shape rather than resolution, rounded up from the
+# natural 875x475 at 0.08 deg to 896x480: both dimensions are multiples of 64,
+# so the resampling kernels and the encoders' row buffers work on aligned,
+# tail-free rows. The extra ~1.7 deg of ocean east and ~0.4 deg north sit off
+# the area of interest.
 EUROPE_AREA = create_area_def(
     "meteosat_europe_latlon",
     {"proj": "latlong"},
-    area_extent=(-25.0, 32.0, 45.0, 70.0),
-    resolution=(0.08, 0.08),
+    shape=(480, 896),
+    area_extent=(-25.0, 32.0, -25.0 + 896 * 0.08, 32.0 + 480 * 0.08),
 )
 
+# Output container: H.264 MP4 by default (fast native encode, 5-10x smaller
+# than GIF for the same frames); set OUTPUT_FORMAT=gif to restore the old
+# GIF pipeline.
+OUTPUT_FORMAT = os.environ.get("OUTPUT_FORMAT", "mp4").lower()
+# Display time of each animation frame, in milliseconds.
+FRAME_DURATION_MS = 250
+# Frame rate of the MP4 output, matching FRAME_DURATION_MS.
+ANIMATION_FPS = round(1000 / FRAME_DURATION_MS)
+# Frames wider than this are downscaled before encoding: palette mapping and
+# LZW/H.264 cost scale with pixel count, and the smaller file stays well
+# clear of X's upload limits. The default matches the EUROPE_AREA grid width
+# so frames normally skip the resize entirely and keep their 64-aligned,
+# macroblock-friendly 896x480 shape all the way into the encoders.
+GIF_MAX_WIDTH = int(os.environ.get("GIF_MAX_WIDTH", "896"))
 # Process only one scene every N products to keep runtime manageable.
 PRODUCT_SAMPLE_STEP = 1
+# Concurrent product downloads; transfers are network-bound, so a handful of
+# workers hides most of the HTTP latency behind the satpy processing.
+DOWNLOAD_WORKERS = int(os.environ.get("DOWNLOAD_WORKERS", "8"))
+# Concurrent render processes; the satpy/dask work is CPU-bound, so one
+# process per core sidesteps the GIL.
+RENDER_WORKERS = int(os.environ.get("RENDER_WORKERS", str(os.cpu_count() or 2)))
+
+try:
+    import eumdac.request
+
+    # eumdac builds a throwaway Session *and* HTTPAdapter for every HTTP
+    # call, so no connection ever survives to the next one. Keep-alive
+    # connections live in the adapter's pool, not the session, so handing
+    # every call one shared adapter - sized to the download concurrency and
+    # keeping eumdac's own retry-and-log policy - lets searches and product
+    # downloads reuse TLS connections even though eumdac still wraps them in
+    # fresh sessions. Same style as the zipfile/ISA-L patch above.
+    _EUMDAC_ADAPTER = HTTPAdapter(
+        pool_connections=DOWNLOAD_WORKERS,
+        pool_maxsize=DOWNLOAD_WORKERS,
+        max_retries=eumdac.request.RetryAndLog(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH"],
+            raise_on_status=False,
+        ),
+    )
+    eumdac.request._get_adapter = lambda max_retries, backoff_factor: _EUMDAC_ADAPTER
+except (ImportError, AttributeError):
+    pass
 # Optional: Set to a tuple like (30, 50) to process only that index range for debugging
 # Set to None to process all products
 DEBUG_INDEX_RANGE = None  # e.g. (42, 48) to process only products 42-48
 
 
-def find_products():
-    consumer_key = os.environ["EUMETSAT_KEY"]
-    consumer_secret = os.environ["EUMETSAT_SECRET"]
+_DATASTORE = None
+
+
+def _get_datastore():
+    """Return the EUMETSAT datastore client, building it once per process.
 
-    token = eumdac.AccessToken((consumer_key, consumer_secret))
-    datastore = eumdac.DataStore(token)
+    The access token is reused by every search and product download
+    afterwards, so only the first caller pays for the OAuth round trip;
+    connection reuse itself is handled by the shared adapter installed into
+    eumdac.request at import time.
+    """
+    global _DATASTORE
+    if _DATASTORE is None:
+        consumer_key = os.environ["EUMETSAT_KEY"]
+        consumer_secret = os.environ["EUMETSAT_SECRET"]
+        token = eumdac.AccessToken((consumer_key, consumer_secret))
+        _DATASTORE = eumdac.DataStore(token)
+    return _DATASTORE
 
+
+def find_products():
+    datastore = _get_datastore()
     collection = datastore.get_collection("EO:EUM:DAT:MSG:HRSEVIRI")
 
     today_utc = datetime.now(timezone.utc).date()
@@ -59,42 +174,426 @@ def find_products():
     end = start + timedelta(days=1)
 
     bbox = "-25.0,33.0,45.0,72.0"  # broad Europe region
-    for offset_hours in (0, 1, 2):
-        attempt_start = start - timedelta(hours=offset_hours)
-        attempt_end = end - timedelta(hours=offset_hours)
-        logger.info(
-            "Searching SEVIRI products between %s and %s (bbox=%s)",
-            attempt_start.isoformat(),
-            attempt_end.isoformat(),
-            bbox,
+    # One widened search replaces the old retry loop (base window plus two
+    # one-hour fallback shifts): a single HTTP round trip covers all three
+    # windows and the results come back already sorted by start time.
+    search_start = start - timedelta(hours=2)
+    logger.info(
+        "Searching SEVIRI products between %s and %s (bbox=%s)",
+        search_start.isoformat(),
+        end.isoformat(),
+        bbox,
+    )
+    products = collection.search(
+        dtstart=search_start,
+        dtend=end,
+        bbox=bbox,
+        sort="start,time,1",
+    )
+    if products.total_results == 0:
+        raise NoDataAvailable(
+            "No MSG SEVIRI data found between "
+            f"{search_start.isoformat()} and {end.isoformat()}."
         )
-        products = collection.search(
-            dtstart=attempt_start,
-            dtend=attempt_end,
-            bbox=bbox,
-            sort="start,time,1",
+
+    # Bucket the results client-side to keep the old window preference: the
+    # animation covers the base day whenever it has data, and the extra two
+    # hours fetched before it are used only as a fallback.
+    all_products = list(products)
+
+    def _in_base_window(product):
+        sensing_start = product.sensing_start
+        if sensing_start.tzinfo is None:
+            sensing_start = sensing_start.replace(tzinfo=timezone.utc)
+        return sensing_start >= start
+
+    selected = [product for product in all_products if _in_base_window(product)]
+    if not selected:
+        logger.warning(
+            "No MSG SEVIRI data found between %s and %s, falling back to up "
+            "to two hours earlier.",
+            start.isoformat(),
+            end.isoformat(),
         )
-        if products.total_results > 0:
-            logger.info(
-                "Using %d products from window %s to %s",
-                products.total_results,
-                attempt_start.isoformat(),
-                attempt_end.isoformat(),
+        selected = all_products
+    logger.info(
+        "Using %d of %d products from window %s to %s",
+        len(selected),
+        len(all_products),
+        search_start.isoformat(),
+        end.isoformat(),
+    )
+    return selected, len(selected)
+
+
+def _download_nat_via_range(product, tmp_path):
+    """Fetch only a product's .nat members using HTTP Range requests.
+
+    remotezip reads the archive's central directory with a small ranged GET
+    and then fetches just the members we ask for, skipping the sidecar
+    bytes entirely. Returns the extracted files, or None when remotezip is
+    unavailable, the product exposes no direct URL, or the server refuses
+    ranged reads - the caller then falls back to the full download.
+    """
+    if RemoteZip is None:
+        return None
+    url = getattr(product, "url", None)
+    if not url:
+        return None
+    try:
+        headers = {}
+        datastore = getattr(product, "datastore", None)
+        if datastore is not None:
+            headers["Authorization"] = f"Bearer {datastore.token}"
+        with RemoteZip(str(url), headers=headers) as remote_zip:
+            for member in remote_zip.namelist():
+                if member.endswith(".nat"):
+                    remote_zip.extract(member, tmp_path)
+        return sorted(tmp_path.glob("*.nat")) or None
+    except Exception as exc:
+        logger.debug("Ranged download unavailable for %s: %s", product, exc)
+        return None
+
+
+def _download_product(product, index, total_results, out_dir):
+    """Download and extract one product into its own temporary directory.
+
+    Returns ``(index, tmp_path, nat_files)`` on success, or
+    ``(index, None, None)`` if the product could not be downloaded or
+    contained no usable data. The caller is responsible for removing
+    ``tmp_path`` once the frames are rendered.
+    """
+    tmp_path = pathlib.Path(tempfile.mkdtemp(dir=out_dir))
+    nat_files = _download_nat_via_range(product, tmp_path)
+    if nat_files:
+        logger.info(
+            "[%d/%d] Downloaded .nat members of %s via ranged reads",
+            index,
+            total_results,
+            product,
+        )
+        return index, tmp_path, nat_files
+
+    # The archive is spooled in RAM rather than staged on disk; writing it
+    # out just to re-read it for extraction doubles the file-system traffic
+    # per product. Only an archive larger than max_size spills to disk, so a
+    # pathological product cannot exhaust memory with several downloads in
+    # flight.
+    with tempfile.SpooledTemporaryFile(max_size=256 << 20) as spool:
+        try:
+            with product.open() as fsrc:
+                shutil.copyfileobj(fsrc, spool, length=1 << 20)
+                name = getattr(fsrc, "name", f"product_{index}.zip")
+            logger.info("[%d/%d] Downloaded %s", index, total_results, name)
+        except Exception as exc:
+            logger.warning("[%d/%d] Failed to download product %s: %s", index, total_results, product, exc)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return index, None, None
+
+        spool.seek(0)
+        try:
+            with zipfile.ZipFile(spool) as zip_ref:
+                # Only the .nat payload is needed; skip the XML/JPEG sidecars
+                # EUMETSAT ships in the same archive.
+                for member in zip_ref.namelist():
+                    if member.endswith(".nat"):
+                        zip_ref.extract(member, tmp_path)
+        except zipfile.BadZipFile as exc:
+            logger.warning("Skipping corrupted archive %s: %s", name, exc)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return index, None, None
+
+    nat_files = sorted(tmp_path.glob("*.nat"))
+    if not nat_files:
+        logger.warning("No .nat files found in archive %s", name)
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return index, None, None
+    return index, tmp_path, nat_files
+
+
+def _init_render_worker():
+    """Configure dask inside each render subprocess.
+
+    The process pool already provides one worker per core, so neither dask
+    nor the BLAS/OpenMP layers underneath numpy may spawn their own thread
+    pools on top of that.
+    """
+    os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["OPENBLAS_NUM_THREADS"] = "1"
+    dask.config.set(scheduler="synchronous")
+
+
+def _frame_cache_key(nat_files):
+    """Content hash of a product's .nat files, used to address cached frames."""
+    digest = hashlib.blake2b(digest_size=16)
+    for nat in nat_files:
+        digest.update(nat.read_bytes())
+    return digest.hexdigest()
+
+
+def _prune_frame_cache(max_age_hours=48):
+    """Drop cached frames left over from previous days.
+
+    Entries are content-addressed, so once the target date moves on they can
+    never be hit again and would otherwise accumulate forever.
+    """
+    cache_dir = pathlib.Path(FRAME_CACHE_DIR)
+    if not cache_dir.is_dir():
+        return
+    cutoff = time.time() - max_age_hours * 3600
+    for path in cache_dir.glob("*.npy"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _render_product(nat_files):
+    """Render one product's .nat segments into a single RGB frame array.
+
+    All segments of a time slot feed one Scene, so satpy parses the headers
+    once and builds one dask graph across them instead of one per segment.
+    Rendered frames are cached under FRAME_CACHE_DIR keyed by the .nat
+    content, so rerunning on the same data skips satpy entirely. Returns
+    None on failure. Runs in a render subprocess; everything it touches must
+    be picklable.
+    """
+    cache_path = None
+    try:
+        cache_dir = pathlib.Path(FRAME_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = cache_dir / f"{_frame_cache_key(nat_files)}.npy"
+        if cache_path.exists():
+            logger.info("Using cached frame for %s", nat_files[0].name)
+            return np.load(cache_path)
+    except Exception as exc:
+        logger.warning("Frame cache lookup failed for %s: %s", nat_files[0].name, exc)
+        cache_path = None
+
+    try:
+        # Catch quality warnings and skip corrupted files
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            scn = Scene(
+                reader="seviri_l1b_native",
+                filenames=[str(nat) for nat in nat_files],
             )
-            return products, products.total_results
-        logger.warning(
-            "No MSG SEVIRI data found between %s and %s, retrying with an additional one-hour offset.",
-            attempt_start.isoformat(),
-            attempt_end.isoformat(),
+
+            # Check if quality warning was raised
+            quality_warnings = [warning for warning in w
+                              if "quality flag" in str(warning.message).lower()]
+            if quality_warnings:
+                logger.warning(
+                    "Skipping %s due to quality flag issue: %s",
+                    nat_files[0].name,
+                    quality_warnings[0].message
+                )
+                return None
+
+        scn.load(["natural_color"])
+        # SEVIRI covers the full disk; slice the source down to the Europe
+        # box first so the resampling math only ever sees the roughly tenth
+        # of the pixels that can land in the target grid.
+        scn = scn.crop(area=EUROPE_AREA)
+        scn = scn.resample(
+            EUROPE_AREA,
+            resampler="nearest",
+            cache_dir=SATPY_CACHE_DIR,
+            reduce_data=True,
+            radius_of_influence=10000,
         )
-    raise NoDataAvailable(
-        "No MSG SEVIRI data found after checking the default window and two one-hour fallbacks."
+        # Pull the enhanced composite straight out of satpy instead of writing
+        # a PNG and reading it back, which paid for a libpng encode + decode
+        # per frame.
+        img = get_enhanced_image(scn["natural_color"])
+        arr = img.data.transpose("y", "x", "bands").values
+        arr = (arr * 255).clip(0, 255).astype(np.uint8)
+        # The enhanced composite may carry an alpha band; the encoders only
+        # consume RGB, so drop it here and make the buffer contiguous rather
+        # than letting Pillow strip it per frame.
+        arr = np.ascontiguousarray(arr[..., :3])
+        if arr.shape[1] > GIF_MAX_WIDTH:
+            # Both output dimensions are rounded to multiples of 8: yuv420p
+            # needs even sizes and _write_mp4 passes macro_block_size=8, so
+            # anything else makes ffmpeg silently rescale every frame again.
+            width = GIF_MAX_WIDTH - GIF_MAX_WIDTH % 8
+            height = max(8, round(arr.shape[0] * width / arr.shape[1] / 8) * 8)
+            arr = np.asarray(
+                Image.fromarray(arr).resize(
+                    (width, height), Image.Resampling.BILINEAR
+                )
+            )
+        if cache_path is not None:
+            try:
+                np.save(cache_path, arr)
+            except OSError as exc:
+                logger.warning("Failed to cache frame for %s: %s", nat_files[0].name, exc)
+        return arr
+    except Exception as exc:
+        logger.warning("Error processing %s: %s", nat_files[0].name, exc)
+        return None
+
+
+def _rendered_frames(selected, total_results, out_dir):
+    """Yield rendered frames in product order while downloads run in a pool.
+
+    Downloads are dispatched to a thread pool and completed products are
+    handed straight to a process pool that renders them, so several cores
+    resample scenes while further transfers are in flight. Only a small
+    window of downloads is kept in flight so the pipeline applies
+    backpressure to the downloaders, and frames of out-of-order completions
+    are held back until every earlier product has been yielded.
+    """
+    expected = deque(index for index, _ in selected)
+    rendering = {}  # index -> (tmp_path, render future); (None, None) on failure
+    remaining = iter(selected)
+    max_in_flight = DOWNLOAD_WORKERS + 2
+    with ProcessPoolExecutor(
+        max_workers=RENDER_WORKERS, initializer=_init_render_worker
+    ) as render_pool, ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        in_flight = {
+            executor.submit(_download_product, product, index, total_results, out_dir)
+            for index, product in islice(remaining, max_in_flight)
+        }
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for index, product in islice(remaining, len(done)):
+                in_flight.add(
+                    executor.submit(_download_product, product, index, total_results, out_dir)
+                )
+            for future in done:
+                index, tmp_path, nat_files = future.result()
+                if nat_files:
+                    rendering[index] = (
+                        tmp_path,
+                        render_pool.submit(_render_product, nat_files),
+                    )
+                else:
+                    rendering[index] = (None, None)
+            # Flush in product order; blocking on the head product's render
+            # is fine since later renders and downloads keep running in their
+            # own processes/threads meanwhile.
+            while expected and expected[0] in rendering:
+                tmp_path, render_future = rendering.pop(expected.popleft())
+                try:
+                    if render_future is not None:
+                        frame = render_future.result()
+                        if frame is not None:
+                            yield frame
+                finally:
+                    # Drop each product's scratch dir as soon as it is
+                    # rendered so disk usage stays bounded by the number of
+                    # in-flight workers.
+                    if tmp_path is not None:
+                        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _deduplicated(frames):
+    """Collapse runs of identical consecutive frames into single frames.
+
+    SEVIRI occasionally repeats a scan (retransmissions, near-identical
+    night-time fields); encoding the repeats wastes LZW work and bytes.
+    Yields ``(frame, duration_ms)`` pairs where the duration of a collapsed
+    run is the sum of its frames' durations. A frame is held back until the
+    next distinct one arrives so durations are final when yielded.
+    """
+    pending = None  # (fingerprint, frame, duration_ms)
+    for arr in frames:
+        digest = hashlib.blake2b(arr.tobytes(), digest_size=8).digest()
+        if pending is not None and digest == pending[0]:
+            pending = (digest, pending[1], pending[2] + FRAME_DURATION_MS)
+            continue
+        if pending is not None:
+            yield pending[1], pending[2]
+        pending = (digest, arr, FRAME_DURATION_MS)
+    if pending is not None:
+        yield pending[1], pending[2]
+
+
+def _write_gif(frames, gif_path):
+    """Stream frames into a GIF using one palette shared by every frame.
+
+    Consecutive natural-color frames have nearly identical color
+    distributions, so one palette computed from the first frame is quantized
+    against for all of them. That skips the per-frame palette search and
+    keeps colors stable across the animation. Duplicate consecutive frames
+    are collapsed and carry their summed duration. Returns the number of
+    frames written (0 when ``frames`` was empty).
+    """
+    deduplicated = _deduplicated(frames)
+    try:
+        first, first_duration = next(deduplicated)
+    except StopIteration:
+        return 0
+
+    # The palette is derived from a 4x-downsampled copy of the first frame:
+    # the octree sees 16x fewer pixels, and on smooth natural-color imagery
+    # the resulting color table is indistinguishable from the full-frame one.
+    sample = Image.fromarray(np.ascontiguousarray(first[::4, ::4]))
+    palette = sample.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+    first_img = Image.fromarray(first).quantize(
+        palette=palette, dither=Image.Dither.NONE
     )
+    first_img.info["duration"] = first_duration
+    written = 1
+
+    def _quantized():
+        nonlocal written
+        for arr, duration in deduplicated:
+            written += 1
+            img = Image.fromarray(arr).quantize(
+                palette=palette, dither=Image.Dither.NONE
+            )
+            img.info["duration"] = duration
+            yield img
+
+    # No global `duration` kwarg: Pillow picks each frame's duration up from
+    # its info dict, which is how the summed durations of collapsed runs
+    # survive the streaming write.
+    # Default frame disposal (leave the previous frame in place) is kept
+    # deliberately: clearing the canvas between frames (disposal=2) would
+    # defeat Pillow's delta encoding of the mostly-static background.
+    first_img.save(
+        gif_path,
+        save_all=True,
+        append_images=_quantized(),
+        loop=0,
+        optimize=False,
+    )
+    return written
+
+
+def _write_mp4(frames, mp4_path):
+    """Stream frames into an H.264 MP4 at the animation frame rate.
+
+    Duplicate consecutive frames are left in: the encoder's inter-frame
+    prediction reduces them to a few bytes, so collapsing them here would
+    only change the playback timing. Returns the number of frames written.
+    """
+    written = 0
+    writer = None
+    try:
+        for arr in frames:
+            if writer is None:
+                writer = imageio.get_writer(
+                    str(mp4_path),
+                    fps=ANIMATION_FPS,
+                    codec="libx264",
+                    pixelformat="yuv420p",
+                    macro_block_size=8,
+                )
+            writer.append_data(arr)
+            written += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
 
 
 def extract_and_generate(products, total_results, out_dir, sample_step=PRODUCT_SAMPLE_STEP):
     out_dir.mkdir(parents=True, exist_ok=True)
-    frames = []
+    _prune_frame_cache()
 
     if sample_step > 1:
         logger.info(
@@ -108,140 +607,103 @@ def extract_and_generate(products, total_results, out_dir, sample_step=PRODUCT_S
     if DEBUG_INDEX_RANGE:
         logger.info("DEBUG: Will only process products in range %s", DEBUG_INDEX_RANGE)
 
-    for index, product in enumerate(products, start=1):
-        if DEBUG_INDEX_RANGE:
-            start_idx, end_idx = DEBUG_INDEX_RANGE
-            if index < start_idx or index > end_idx:
-                continue
-
-        if (index - 1) % sample_step != 0:
-            logger.debug(
-                "Skipping product %d/%d due to sampling (step=%d)",
-                index,
-                total_results,
-                sample_step,
-            )
-            continue
-        with tempfile.TemporaryDirectory(dir=out_dir) as tmp_dir:
-            tmp_path = pathlib.Path(tmp_dir)
-            zip_path = tmp_path / "product.zip"
-            try:
-                with product.open() as fsrc, open(zip_path, "wb") as fdst:
-                    shutil.copyfileobj(fsrc, fdst)
-                    name = getattr(fsrc, "name", f"product_{index}.zip")
-                logger.info("[%d/%d] Downloaded %s", index, total_results, name)
-            except Exception as exc:
-                logger.warning("[%d/%d] Failed to download product %s: %s", index, total_results, product, exc)
-                continue
+    # Slice the product iterator lazily: skipped products are never touched,
+    # so eumdac does not fetch metadata for them.
+    product_iter = iter(products)
+    first_index = 1
+    if DEBUG_INDEX_RANGE:
+        start_idx, end_idx = DEBUG_INDEX_RANGE
+        product_iter = islice(product_iter, start_idx - 1, end_idx)
+        first_index = start_idx
+    selected = list(
+        islice(enumerate(product_iter, start=first_index), 0, None, sample_step)
+    )
 
-            try:
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(tmp_path)
-            except zipfile.BadZipFile as exc:
-                logger.warning("Skipping corrupted archive %s: %s", name, exc)
-                continue
-
-            nat_files = sorted(tmp_path.glob("*.nat"))
-            if not nat_files:
-                logger.warning("No .nat files found in archive %s", name)
-                continue
-
-            for nat in nat_files:
-                try:
-                    # Catch quality warnings and skip corrupted files
-                    with warnings.catch_warnings(record=True) as w:
-                        warnings.simplefilter("always")
-                        scn = Scene(reader="seviri_l1b_native", filenames=[str(nat)])
-
-                        # Check if quality warning was raised
-                        quality_warnings = [warning for warning in w
-                                          if "quality flag" in str(warning.message).lower()]
-                        if quality_warnings:
-                            logger.warning(
-                                "Skipping %s due to quality flag issue: %s",
-                                nat.name,
-                                quality_warnings[0].message
-                            )
-                            continue
-
-                    scn.load(["natural_color"])
-                    scn = scn.resample(EUROPE_AREA)
-                    out_png = tmp_path / f"{nat.stem}.png"
-                    scn.save_dataset("natural_color", filename=str(out_png))
-                    frames.append(iio.imread(out_png))
-                except Exception as exc:
-                    logger.warning("Error processing %s: %s", nat.name, exc)
-
-    if not frames:
+    # Downloads are dispatched to a thread pool so several transfers overlap;
+    # rendering stays on the main thread and consumes products as they land.
+    # Only a small window of downloads is kept in flight so the renderer
+    # applies backpressure to the downloaders and downloads of later products
+    # overlap with the satpy work on earlier ones.
+    frames = _rendered_frames(selected, total_results, out_dir)
+    if OUTPUT_FORMAT == "gif":
+        media_path = out_dir / "Meteosat_Europe.gif"
+        frame_count = _write_gif(frames, media_path)
+    else:
+        media_path = out_dir / "Meteosat_Europe.mp4"
+        frame_count = _write_mp4(frames, media_path)
+
+    if frame_count == 0:
         raise RuntimeError("No frames generated from extracted data.")
 
-    gif_path = out_dir / "Meteosat_Europe.gif"
-    iio.imwrite(gif_path, frames, duration=0.25, loop=0)
     logger.info(
-        "GIF saved to %s using %d frames out of %d products (step=%d)",
-        gif_path,
-        len(frames),
+        "Animation saved to %s using %d frames out of %d products (step=%d)",
+        media_path,
+        frame_count,
         total_results,
         sample_step,
     )
-    return gif_path
+    return media_path
+
+
+_OPENERS = (
+    "You were right there!",
+    "A peaceful orbit above Europe.",
+    "I hope you had a beautiful day under this sky.",
+    "Let's hope today brings even clearer skies.",
+    "Clouds may come and go, beauty stays above.",
+    "From 36,000 km away, this was yesterday’s Europe.",
+    "Every day, another view of our shared atmosphere.",
+    "A reminder of how small and connected we all are.",
+    "Yesterday’s Earth from space!",
+)
+
+_CORE_TAGS = ("#Meteosat", "#EUMETSAT", "#EarthObservation")
+_SCIENCE_POOL = (
+    "#SatelliteImagery",
+    "#WeatherSatellite",
+    "#RemoteSensing",
+    "#Geostationary",
+)
+_PUBLIC_POOL = (
+    "#FromSpace",
+    "#OurPlanet",
+    "#EarthFromSpace",
+    "#PlanetEarth",
+    "#BlueMarble",
+    "#Weather",
+    "#Clouds",
+    "#Storms",
+    "#Climate",
+    "#PicOfTheDay",
+    "#PhotoOfTheDay",
+    "#SpacePhotography",
+    "#NaturePhotography",
+    "#GoodMorningEurope",
+    "#YesterdayFromSpace",
+    "#DailyView",
+    "#SkyWatch",
+    "#Satellite",
+    "#Space",
+    "#Orbit",
+    "#SpaceScience",
+)
+
+# Every hashtag line the bot can emit (core tags + one science tag + two
+# public tags), expanded once at import since the pools are constant. Tags
+# are sorted so identical combinations always render identically, and the
+# per-run work reduces to one random.choice.
+_HASHTAG_LINES = tuple(
+    " ".join(sorted({*_CORE_TAGS, science, first, second}))
+    for science in _SCIENCE_POOL
+    for first, second in combinations(_PUBLIC_POOL, 2)
+)
 
 
 def build_success_message() -> str:
     yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
     date_str = yesterday.strftime("%B %d, %Y")
-    openers = [
-        "You were right there!",
-        "A peaceful orbit above Europe.",
-        "I hope you had a beautiful day under this sky.",
-        "Let's hope today brings even clearer skies.",
-        "Clouds may come and go, beauty stays above.",
-        "From 36,000 km away, this was yesterday’s Europe.",
-        "Every day, another view of our shared atmosphere.",
-        "A reminder of how small and connected we all are.",
-        "Yesterday’s Earth from space!",
-    ]
-    opener = random.choice(openers)
-
-    core_tags = ["#Meteosat", "#EUMETSAT", "#EarthObservation"]
-    science_pool = [
-        "#SatelliteImagery",
-        "#WeatherSatellite",
-        "#RemoteSensing",
-        "#Geostationary",
-    ]
-    public_pool = [
-        "#FromSpace",
-        "#OurPlanet",
-        "#EarthFromSpace",
-        "#PlanetEarth",
-        "#BlueMarble",
-        "#Weather",
-        "#Clouds",
-        "#Storms",
-        "#Climate",
-        "#PicOfTheDay",
-        "#PhotoOfTheDay",
-        "#SpacePhotography",
-        "#NaturePhotography",
-        "#GoodMorningEurope",
-        "#YesterdayFromSpace",
-        "#DailyView",
-        "#SkyWatch",
-        "#Satellite",
-        "#Space",
-        "#Orbit",
-        "#SpaceScience",
-    ]
-
-    hashtag_set = set(core_tags)
-    science_choice = random.sample(science_pool, k=1)
-    hashtag_set.update(science_choice)
-    public_choice = random.sample(public_pool, k=2)
-    hashtag_set.update(public_choice)
-    hashtag_list = list(hashtag_set)
-    random.shuffle(hashtag_list)
-    hashtags = " ".join(hashtag_list)
+    opener = random.choice(_OPENERS)
+    hashtags = random.choice(_HASHTAG_LINES)
 
     return (
         f"{opener}\n\n"
@@ -250,7 +712,81 @@ def build_success_message() -> str:
         f"{hashtags}"
     )
 
-def post_to_x(message, gif_path=None):
+UPLOAD_ENDPOINT = "https://upload.twitter.com/1.1/media/upload.json"
+# Segment size and concurrency for chunked media uploads; X accepts APPENDs
+# out of order, so several segments can be in flight at once.
+UPLOAD_SEGMENT_BYTES = 4 * 1024 * 1024
+UPLOAD_WORKERS = 4
+
+
+def _chunked_media_upload(session, oauth, media_path, media_type, media_category):
+    """Upload media via INIT/APPEND/FINALIZE with concurrent APPENDs.
+
+    tweepy's chunked uploader posts its segments one at a time; since the
+    endpoint allows out-of-order segment_index values, the APPENDs are
+    issued from a small thread pool instead and the upload scales with the
+    number of segments in flight. Returns the media id string once the
+    server-side processing has succeeded.
+    """
+    file_size = media_path.stat().st_size
+    response = session.post(
+        UPLOAD_ENDPOINT,
+        data={
+            "command": "INIT",
+            "total_bytes": file_size,
+            "media_type": media_type,
+            "media_category": media_category,
+        },
+        auth=oauth,
+    )
+    response.raise_for_status()
+    media_id = response.json()["media_id_string"]
+
+    def _append(segment_index, chunk):
+        append_response = session.post(
+            UPLOAD_ENDPOINT,
+            data={
+                "command": "APPEND",
+                "media_id": media_id,
+                "segment_index": segment_index,
+            },
+            files={"media": chunk},
+            auth=oauth,
+        )
+        append_response.raise_for_status()
+
+    with media_path.open("rb") as fsrc, ThreadPoolExecutor(
+        max_workers=UPLOAD_WORKERS
+    ) as pool:
+        appends = [
+            pool.submit(_append, segment_index, chunk)
+            for segment_index, chunk in enumerate(
+                iter(lambda: fsrc.read(UPLOAD_SEGMENT_BYTES), b"")
+            )
+        ]
+        for append in appends:
+            append.result()
+
+    response = session.post(
+        UPLOAD_ENDPOINT, data={"command": "FINALIZE", "media_id": media_id}, auth=oauth
+    )
+    response.raise_for_status()
+    processing_info = response.json().get("processing_info")
+    while processing_info and processing_info.get("state") in ("pending", "in_progress"):
+        time.sleep(processing_info.get("check_after_secs", 1))
+        response = session.get(
+            UPLOAD_ENDPOINT,
+            params={"command": "STATUS", "media_id": media_id},
+            auth=oauth,
+        )
+        response.raise_for_status()
+        processing_info = response.json().get("processing_info")
+    if processing_info and processing_info.get("state") != "succeeded":
+        raise RuntimeError(f"Media processing failed: {processing_info}")
+    return media_id
+
+
+def post_to_x(message, media_path=None):
     consumer_key = os.environ["X_API_KEY"]
     consumer_secret = os.environ["X_API_SECRET"]
     access_token = os.environ["X_ACCESS_TOKEN"]
@@ -262,36 +798,45 @@ def post_to_x(message, gif_path=None):
         access_token=access_token,
         access_token_secret=access_secret,
     )
+    api_v1 = tweepy.API(auth)
+    client = tweepy.Client(
+        consumer_key=consumer_key,
+        consumer_secret=consumer_secret,
+        access_token=access_token,
+        access_token_secret=access_secret,
+    )
+    # Both API objects otherwise build their own requests.Session; sharing
+    # one lets the connection opened during the media upload stay alive for
+    # the tweet itself instead of paying a second TLS handshake.
+    client.session = api_v1.session
+
     media_id = None
-    if gif_path is not None:
-        api_v1 = tweepy.API(auth)
-        logger.info("Uploading media %s", gif_path)
-        file_size = gif_path.stat().st_size
-        upload_kwargs = {
-            "filename": str(gif_path),
-        }
+    if media_path is not None:
+        file_size = media_path.stat().st_size
+        if media_path.suffix == ".mp4":
+            # Videos always go through the chunked upload endpoint.
+            media_type, media_category = "video/mp4", "tweet_video"
         # For smaller GIFs, don't specify media_category - let Twitter auto-detect
         # For larger files, use chunked upload
-        if file_size > 5 * 1024 * 1024:
-            upload_kwargs["chunked"] = True
-            upload_kwargs["media_category"] = "tweet_gif"
+        elif file_size > 5 * 1024 * 1024:
+            media_type, media_category = "image/gif", "tweet_gif"
+        else:
+            media_type = media_category = None
 
         logger.info(
             "Uploading media %s (%.2f MB)%s",
-            gif_path,
+            media_path,
             file_size / (1024 * 1024),
-            " with chunked upload" if "chunked" in upload_kwargs else "",
+            " with chunked upload" if media_category else "",
         )
-        media = api_v1.media_upload(**upload_kwargs)
-
-        media_id = media.media_id_string
+        if media_category:
+            media_id = _chunked_media_upload(
+                api_v1.session, auth.apply_auth(), media_path, media_type, media_category
+            )
+        else:
+            media = api_v1.media_upload(filename=str(media_path))
+            media_id = media.media_id_string
 
-    client = tweepy.Client(
-        consumer_key=consumer_key,
-        consumer_secret=consumer_secret,
-        access_token=access_token,
-        access_token_secret=access_secret,
-    )
     payload = {"text": message}
     if media_id:
         payload["media_ids"] = [media_id]
@@ -310,12 +855,12 @@ if __name__ == "__main__":
         format="%(asctime)s %(levelname)s %(name)s - %(message)s",
     )
     out_dir = pathlib.Path("downloads")
-    gif_path = None
+    media_path = None
 
     try:
         products, total_results = find_products()
-        gif_path = extract_and_generate(products, total_results, out_dir)
-        post_to_x(success_message, gif_path=gif_path)
+        media_path = extract_and_generate(products, total_results, out_dir)
+        post_to_x(success_message, media_path=media_path)
     except NoDataAvailable as exc:
         logger.warning("No data available: %s", exc)
         post_to_x(FALLBACK_MESSAGE)